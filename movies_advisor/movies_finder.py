@@ -6,12 +6,20 @@ Created on Thursday, July 1, 22:42:05 GMT+5, 2021.
 @location: Barranquilla, Colombia
 """
 import re
-from functools import reduce
-import Levenshtein
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
+from functools import lru_cache
+from html import unescape
+from threading import Lock
+from urllib.parse import quote_plus
 
-from bs4 import BeautifulSoup
-from requests import HTTPError, Session, get
+from rapidfuzz import fuzz
+
+from selectolax.parser import HTMLParser
+from requests import Session
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 
 from movies_advisor.utils.log import Logger
 
@@ -21,8 +29,74 @@ FILMAFFINITY_URL_ROOT = "https://www.filmaffinity.com/en/search.php?stext="
 # IMDB sign-in URL
 IMDB_SIGNIN_URL = "https://www.imdb.com/registration/signin?u=/"
 
+# Number of worker threads used to scrape movies concurrently.
+MAX_WORKERS = 8
+
+# Name of the on-disk cache of HTTP responses and how long its entries
+# stay valid.
+CACHE_NAME = "movies_advisor_cache"
+CACHE_EXPIRE_AFTER = 7 * 24 * 3600  # A week, in seconds.
+
+# Unwanted substrings and their replacements, applied by clean_string in a
+# single regex pass instead of one str.replace scan per pattern.
+_CLEAN_MAP = {
+    " (...) ": ". ",
+    " (…) ": ". ",
+    "..": ". ",
+    "“": "",
+    '"': " ",
+    "'": " ",
+    " ,": ", ",
+}
+_CLEAN_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in _CLEAN_MAP))
+_MULTISPACE_RE = re.compile(r" {2,}")
+
+# Trailing Film Affinity markers stripped from cleaned strings.
+_SUFFIX_RE = re.compile(r"(?:\s*(?:\(FILMAFFINITY\)|aka))+\s*$")
+
+# Matches a parenthesized 4-digit release year, e.g. "(2019)".
+_YEAR_RE = re.compile(r"\((\d{4})\)")
+
+# Bytes-level patterns for the title of an IMDb detail page. Scanning the
+# raw HTML once is cheaper than an extra search over the parsed tree.
+_ORIG_TITLE_RE = re.compile(rb'class="originalTitle"[^>]*>([^<]+)')
+_H1_TITLE_RE = re.compile(rb"<h1[^>]*>([^<]+)")
+
+# Default headers for every request. They are used for avoiding the error
+# "exceeded 30 redirects".
+HEADERS = {
+    'Accept-Encoding': 'br, gzip, deflate',
+    'Accept-Language': 'en-US,en;q=0.8',
+    'Upgrade-Insecure-Requests': '1',
+    'User-Agent':
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like '
+    'Gecko) Chrome/56.0.2924.87 Safari/537.36',
+    'Accept':
+    'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,'
+    '*/*;q=0.8',
+    'Cache-Control': 'max-age=0', 'Connection': 'keep-alive'
+}
+
 class MoviesFinder:
     """Handles the parsing of the websites necessary to get the movies."""
+
+    # Film Affinity selectors, built once at class definition instead of
+    # as string literals inside the hot scraping methods (selectolax has
+    # no compiled-selector object to cache, so the constant is the
+    # selector string itself).
+    _MOVIE_PAGE_SELECTOR = ('dl.movie-info > dd, '
+                            'dd[itemprop="description"], '
+                            'div[itemprop="reviewBody"]')
+    _CANDIDATE_SELECTOR = "div.se-it.mt"
+    _CANDIDATE_FIELDS_SELECTOR = "div.ye-w, a[href]"
+
+    # IMDb selectors, hoisted for the same reason.
+    _RESULT_TEXT_SELECTOR = "td.result_text"
+    _TITLE_YEAR_SELECTOR = "span#titleYear a[href]"
+    _RATING_SELECTOR = 'span[itemprop="ratingValue"]'
+    _SIGNIN_LINK_SELECTOR = "a.list-group-item"
+
     def __init__(self, movies: dict, imdb_credentials: dict, number_critics: int = 2):
         """
         Parameters
@@ -42,40 +116,102 @@ class MoviesFinder:
         self._info = dict()
         self._logger = Logger()
 
-    def complete_information(self, verbose: bool = False) -> None:
+        # A single session is shared by every scrape so that urllib3 keeps
+        # warm connection pools per host (HTTP keep-alive), instead of
+        # paying a TCP + TLS handshake on every request. Responses are
+        # also cached on disk, so reruns and retries short-circuit any GET
+        # already seen during the last week; the sign-in POST passes
+        # through uncached (only GETs are allowable).
+        self._session = CachedSession(
+            CACHE_NAME, backend="sqlite",
+            expire_after=CACHE_EXPIRE_AFTER, allowable_methods=("GET",))
+        self._session.headers.update(HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.5))
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # Small dedicated pool for prefetching candidate pages during the
+        # Film Affinity disambiguation. It is separate from the per-movie
+        # pool of complete_information so prefetches submitted from inside
+        # a worker cannot deadlock a saturated pool.
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=4)
+
+        # Signed-in IMDb session, established lazily by the imdb_session
+        # property and reused for every movie. The lock keeps concurrent
+        # workers from signing in more than once.
+        self._imdb_session = None
+        self._imdb_session_lock = Lock()
+
+    def complete_information(self, verbose: bool = False,
+                             max_workers: int = MAX_WORKERS) -> None:
         """Completes the information of each movie.
-        
+
         Parameters
         ----------
             verbose : bool, optional
                 By default, False.
+            max_workers : int, optional
+                Number of worker threads scraping concurrently. By
+                default, MAX_WORKERS.
         """
-        self._info = {
-            movie_name: dict() for movie_name in self.movies
-        }
+        self._info = dict()
 
         # For each movie, this will fill the previous dictionary with the
-        # complete information taken from Film Affinity and IMDb.
-        for movie, year in self.movies.items():
-            if verbose:
-                print(f"Completing {movie} ({year})... ", end="")
-                
-            self.get_useful_information_from_filmaffinity(movie, year)
-            original_name = self._info[movie]["original name"].lower()
-            self.get_useful_information_from_imdb(movie, original_name, year)
-            
-            if verbose:
-                print("Done")
+        # complete information taken from Film Affinity and IMDb. The
+        # workload is network-bound, so the movies are scraped concurrently
+        # by a thread pool; the workers return their results and the
+        # assembly of self._info happens here, on the calling thread.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # The IMDb sign-in depends only on the credentials, so it is
+            # kicked off right away and overlaps with the first batch of
+            # Film Affinity fetches; the workers then find the memoized
+            # session ready instead of blocking on the handshake.
+            executor.submit(lambda: self.imdb_session)
+
+            for movie, info in executor.map(
+                    lambda item: self._process_one(*item),
+                    self.movies.items()):
+                if info is None:  # Fetch failed; already logged.
+                    continue
+
+                self._info[movie] = info
+                if verbose:
+                    print(f"Completed {movie} ({self.movies[movie]})")
+
+    def _process_one(self, movie: str, year: str) -> tuple:
+        """Completes the information of a single movie.
+
+        Parameters
+        ----------
+        movie : str
+            Name of the movie in theaters (probably in spanish).
+        year : str
+            Release year of the movie.
+
+        Returns
+        -------
+        (movie, info) : tuple
+            Name of the processed movie and its complete information.
+        """
+        info = self.get_useful_information_from_filmaffinity(movie, year)
+        if info is None:
+            return movie, None
+
+        original_name = info["original name"].lower()
+        info["imdb_rating"] = self.get_useful_information_from_imdb(
+            original_name, year)
+        return movie, info
 
     def get_useful_information_from_filmaffinity(self, movie_name: str,
                                                  movie_year: str) -> dict:
         """Gets the original name of the movie, synopsis and critics.
 
-        This useful information is stored in a dictionary, where the key 
-        is the name of the movie and its value is another dictionary, 
-        which contains the folowing values: original name, year, synopsis,
-        critics, tomatometer and audience score. The synopsis is a string 
-        and the critics is a list of strings. 
+        This useful information is returned as a dictionary, which contains
+        the folowing values: original name, year, synopsis, critics and
+        imdb_rating. The synopsis is a string and the critics is a list of
+        strings.
 
         Information provider: Film Affinity.
 
@@ -89,26 +225,20 @@ class MoviesFinder:
         Returns
         -------
         useful_information : dict
-            Useful information regarding the movie.
+            Useful information regarding the movie, or None if the search
+            page could not be fetched.
         """
         url_root = FILMAFFINITY_URL_ROOT
 
         # CREATION OF URL
-        # Lowers each word of the list of words in the name of the movie.
-        movie_name_words = list(
-            map(lambda word: word.strip().lower(),
-                movie_name.split(" ")))
-
-        # Constructs a string composed of all the words inside the previous
-        # list separated by a '-'.
-        parsed_movie_name = reduce(
-            lambda a, b: a + "-" + b,
-            movie_name_words
-        ) if len(movie_name_words) > 1 else movie_name_words[0]
+        # Lowers the name of the movie and joins its words with a '-'.
+        parsed_movie_name = "-".join(movie_name.lower().split())
 
         url = url_root + parsed_movie_name + "&stype=all"  # Actual URL
-        
+
         soup = self.soup_from_url(url)
+        if soup is None:  # The search page could not be fetched.
+            return None
 
         # SCRAPING AND CONSTRUCTION OF DICTIONARY
         original_name = ""
@@ -116,61 +246,83 @@ class MoviesFinder:
         synopsis = ""
         critics = list()
 
-        information_tag = soup.select('dl[class="movie-info"] > dd')
+        information_tag, synopsis_tag, critics_tags = \
+            self._extract_movie_page_parts(soup)
 
         # Tests if the movie is unique. If it is not, this will produce an
         # IndexError. If there are, then the actual movie is found using both
         # year and name.
         try:
-            original_name = information_tag[0].text.strip()
+            original_name = information_tag[0].text().strip()
         except IndexError as e:
             message = "Found more than 1 movie for " + \
                 movie_name + ". Original exception: " + str(e)
             self._logger.log(message)
 
             # Looks for all the possible movies.
-            possible_movies_tags = soup.find_all(
-                "div", attrs={"class": "se-it mt"})
+            possible_movies_tags = soup.css(self._CANDIDATE_SELECTOR)
 
-            for possible_movie_tag in possible_movies_tags:
-                year_tag = possible_movie_tag.select('div[class="ye-w"]')
-                title_tag = possible_movie_tag.select("a[href]")
+            # Loop invariants, hoisted so they are not recomputed for every
+            # candidate.
+            movie_name_lower = movie_name.lower()
+            year_int = int(year)
 
-                if title_tag[0].get("title").strip().lower() == \
-                        movie_name.lower():
+            candidate_hrefs = []
+            for possible_movie_tag in possible_movies_tags:
+                # One pass over the candidate subtree for both fields,
+                # mirroring _extract_movie_page_parts.
+                year_tag = title_tag = None
+                for tag in possible_movie_tag.css(
+                        self._CANDIDATE_FIELDS_SELECTOR):
+                    if tag.tag == "div":
+                        year_tag = year_tag or tag
+                    else:
+                        title_tag = title_tag or tag
+
+                if title_tag.attributes.get("title", "").strip().lower() == \
+                        movie_name_lower:
                     # Checks if the information provided by Film Affinity
                     # matches that found in Fandango. In case the name of the
                     # movie matches, but the year does not, this algorithm
                     # accepts it if and only if the year varies +/- 1 year.
-                    if year_tag[0].text.strip() == year or (
-                            int(year) - 1 <= int(year_tag[0].text.strip()) <=
-                            int(year) + 1):
-
-                        # RE-CREATION OF BEAUTIFUL SOUP
-                        soup = self.soup_from_url(title_tag[0].get("href"))
-                        information_tag = soup.select(
-                            'dl[class="movie-info"] > dd')
-                        original_name = information_tag[0].text.strip()
-                        break
+                    candidate_year = year_tag.text().strip()
+                    if candidate_year == year or (
+                            year_int - 1 <= int(candidate_year) <=
+                            year_int + 1):
+                        candidate_hrefs.append(
+                            title_tag.attributes.get("href"))
+
+            # RE-CREATION OF BEAUTIFUL SOUP. All plausible candidate pages
+            # are fetched concurrently, so their round-trips overlap instead
+            # of being paid one by one; the first page that actually carries
+            # the movie information wins.
+            for candidate_soup in self._prefetch_pool.map(
+                    self.soup_from_url, candidate_hrefs):
+                if candidate_soup is None:
+                    continue
+
+                information_tag, synopsis_tag, critics_tags = \
+                    self._extract_movie_page_parts(candidate_soup)
+                if information_tag:
+                    soup = candidate_soup
+                    original_name = information_tag[0].text().strip()
+                    break
 
         # Gets the original name of the movie and formats it.
         original_name = self.clean_string(original_name)
 
         # Gets the synopsis of the movie and formats it.
-        synopsis = soup.find(
-            "dd", attrs={"itemprop": "description"}).text.strip()
+        synopsis = synopsis_tag.text().strip()
         synopsis = self.clean_string(synopsis)
         synopsis += "." if not synopsis.endswith(".") else ""
 
-        # Gets the critics of the movie and makes the necessary formatting
-        # algorithms.
-        critics_tags = soup.select('div[itemprop="reviewBody"]')
-
+        # Makes the necessary formatting algorithms on the critics of the
+        # movie.
         if critics_tags:
+            # Only the first number_critics reviews are kept.
             critics = [
-                self.clean_string(critics_tag.text.strip())
-                for index, critics_tag in enumerate(critics_tags)
-                if index < self.number_critics
+                self.clean_string(critics_tag.text().strip())
+                for critics_tag in critics_tags[:self.number_critics]
             ]
 
             critics = [critic + "."
@@ -183,9 +335,8 @@ class MoviesFinder:
         else:  # In case the list is empty.
             critics = None
 
-        # Constructing the useful information in the desired form and assign
-        # it to its right key.
-        d = {
+        # Constructing the useful information in the desired form.
+        return {
             "original name": original_name,
             "year": year,
             "synopsis": synopsis,
@@ -193,17 +344,44 @@ class MoviesFinder:
             "imdb_rating": None
         }
 
-        self._info[movie_name] = d
+    def _extract_movie_page_parts(self, soup: object) -> tuple:
+        """ Picks the tags of interest out of a Film Affinity movie page.
+
+        A single combined selector traverses the parsed tree once and the
+        matches are demultiplexed afterwards, instead of one full DOM walk
+        per field.
+
+        Parameters
+        ----------
+        soup : selectolax.parser.HTMLParser object
+            Parsed Film Affinity movie page.
+
+        Returns
+        -------
+        (information_tag, synopsis_tag, critics_tags) : tuple
+            The movie-info dd tags, the synopsis dd tag (or None) and the
+            list of critic review tags.
+        """
+        information_tag = []
+        synopsis_tag = None
+        critics_tags = []
+
+        for tag in soup.css(self._MOVIE_PAGE_SELECTOR):
+            if tag.tag == "div":
+                critics_tags.append(tag)
+            else:
+                if tag.attributes.get("itemprop") == "description":
+                    synopsis_tag = tag
+                information_tag.append(tag)
+
+        return information_tag, synopsis_tag, critics_tags
 
-    def get_useful_information_from_imdb(self, movie_name,
-                                         original_movie_name: str,
+    def get_useful_information_from_imdb(self, original_movie_name: str,
                                          movie_year: str) -> float:
         """ Gets the IMDB rating of the movie by using the IMDb module.
 
             Parameters
             ----------
-            movie_name : str
-                Name of the movie in theaters (probably in spanish).
             original_movie_name : str
                 Original name of the movie.
             movie_year : str
@@ -212,67 +390,82 @@ class MoviesFinder:
             Returns
             -------
             imdb_rating : float
-                Useful information regarding the movie. 
+                IMDb rating of the movie, or None if it was not found.
         """
-        s = self.sign_in_to_imdb()  # Gets current session. Signs in to IMDb.
+        s = self.imdb_session  # Gets current session, signed in to IMDb.
 
         url_root = "https://www.imdb.com/find?q="
 
         # CREATION OF URL
-        # Lowers each word of the list of words in the name of the movie.
-        movie_name_words = original_movie_name.split(" ")
-
-        # Constructs a string composed of all the words inside the previous
-        # list separated by a '+'.
-        parsed_movie_name = reduce(
-            lambda a, b: a + "+" + b,
-            movie_name_words
-        ) if len(movie_name_words) > 1 else movie_name_words[0]
+        # quote_plus joins the words with a '+' and percent-encodes any
+        # character that is not URL-safe (accents, colons, ampersands).
+        parsed_movie_name = quote_plus(original_movie_name)
 
         # Actual URL.
         url = url_root + parsed_movie_name + "&ref_=nv_sr_sm"
 
-        # Creation of BeautifulSoup object
+        # Creation of parsed tree
         soup = self.soup_from_url(url, s)
-
-        # Scraping and construction of dictionary
-        search_item_tags = soup.find_all("td", attrs={"class": "result_text"})
-
-        for item in search_item_tags:
-            new_url = "https://www.imdb.com" + item.select("a[href]")[
-                0].get("href")
+        if soup is None:  # The search page could not be fetched.
+            return None
+
+        # Scraping and construction of dictionary. The search page itself
+        # already carries enough to discard most rows without a fetch: the
+        # visible release year rules out mismatches, and rows whose anchor
+        # text equals the original title are tried first. Only the top 3
+        # surviving candidates are worth a detail-page round-trip.
+        candidates = []
+        for item in soup.css(self._RESULT_TEXT_SELECTOR):
+            row_year = self.find_year_in_unformatted_text(item.text())
+            if row_year and row_year != movie_year:
+                continue
+
+            link = item.css_first("a[href]")
+            anchor_text = link.text().strip().lower()
+            candidates.append(
+                (anchor_text != original_movie_name,
+                 link.attributes.get("href")))
+
+        # Stable sort: exact anchor-text matches first, original result
+        # order preserved within each group.
+        candidates.sort(key=lambda candidate: candidate[0])
+
+        for _, href in candidates[:3]:
+            new_url = "https://www.imdb.com" + href
 
             try:
-                soup = self.soup_from_url(new_url, s)
+                html = self._fetch_html(new_url, s)
+                if html is None:
+                    continue
 
                 # First, it tries to find the original title. If it doesn't
-                # exist, it takes the "normal" title.
-                try:
-                    current_movie_name = soup.find("div", attrs={
-                        "class": "originalTitle"
-                    }).text.strip().lower()\
-                        .split("(original title)")[0].strip()
-                except:
-                    current_movie_name = soup.find("div", attrs={
-                        "class": "title_wrapper"
-                    }).select("h1").text.strip().lower()
-
-                current_movie_year = soup.find("span", attrs={
-                    "id": "titleYear"
-                }).select("a[href]")[0].text.strip()
+                # exist, it takes the "normal" title. Both come from one
+                # bytes-level regex scan of the raw page, which skips an
+                # extra walk of the parsed tree; the tree is still needed
+                # below for the year and the rating.
+                match = _ORIG_TITLE_RE.search(html) or \
+                    _H1_TITLE_RE.search(html)
+                if match is None:
+                    continue
+
+                current_movie_name = unescape(
+                    match.group(1).decode("utf-8", "replace")) \
+                    .strip().lower().split("(original title)")[0].strip()
+
+                soup = HTMLParser(html)
+                current_movie_year = soup.css_first(
+                    self._TITLE_YEAR_SELECTOR).text().strip()
 
                 if self.title_is_accurate(current_movie_name,
                                           original_movie_name) and \
                         current_movie_year == movie_year:
-                    imdb_rating = soup.find("span", attrs={
-                        "itemprop": "ratingValue"
-                    }).text.strip()
-                    self._info[movie_name][
-                        "imdb_rating"] = imdb_rating
-                    return
+                    return soup.css_first(
+                        self._RATING_SELECTOR).text().strip()
             except Exception as e:
                 self._logger.log(str(e))
 
+        return None
+
     def clean_string(self, string: str) -> str:
         """ Cleans the given string.
 
@@ -288,25 +481,11 @@ class MoviesFinder:
             cleaned_string : str
                 Cleaned/Formatted string.
         """
-        string = (
-            string.replace('"', " ")
-            .replace("'", " ")
-            .replace("',", ", ")
-            .replace("'", "")
-            .replace(" (...) ", ". ")
-            .replace(" (…) ", ". ")
-            .replace("“", "")
-            .replace("..", ". ")
-            .replace(" ,", ", ")
-            .replace("  ", " ")
-            .strip()
-        )
-
-        if string.endswith("(FILMAFFINITY)"):
-            string = string[:-14].strip()
-
-        if string.endswith('aka'):
-            string = string[:-3].strip()
+        # One pass over the string for every unwanted pattern, plus one to
+        # collapse the whitespace runs the substitutions may leave behind.
+        string = _CLEAN_RE.sub(lambda m: _CLEAN_MAP[m.group(0)], string)
+        string = _MULTISPACE_RE.sub(" ", string).strip()
+        string = _SUFFIX_RE.sub("", string)
 
         return string
 
@@ -328,56 +507,92 @@ class MoviesFinder:
             year : str
                 Release year.
         """
-        possible_year = ""
-        inside_parentheses = re.findall('\(.*?\)', string)
-        for stuff in inside_parentheses:
-            if stuff[1:-1].isdigit():
-                possible_year = stuff[1:-1]
-                break
-
-        return possible_year
+        match = _YEAR_RE.search(string)
+        return match.group(1) if match else ""
 
     def soup_from_url(self, url: str, s: Session = None) -> object:
-        """ Gets the BeautifulSoup object from a url using the requests module.
+        """ Gets the parsed HTML tree from a url using the requests module.
 
-        Headers are used for avoiding the error "exceeded 30 redirects".
+        selectolax parses in C with no Python object per tag, which makes
+        it an order of magnitude faster than BeautifulSoup for the simple
+        tag + attribute selectors used here.
 
         Parameters
         ----------
         url : str
-            URL to get the BeautifulSoup object from.
+            URL to get the parsed HTML tree from.
         s : requests.Session
-            Current session. Its default value is None.
+            Session to request through instead of the shared one. Its
+            default value is None.
 
         Returns
         -------
-        soup : BeautifulSoup object
+        soup : selectolax.parser.HTMLParser object
+            Parsed tree, or None if the request failed.
+        """
+        html = self._fetch_html(url, s)
+        if html is None:  # Already logged by _fetch_html.
+            return None
+
+        # Raw bytes let the parser sniff the encoding itself, avoiding a
+        # redundant decode of the whole body. A fresh tree is parsed per
+        # call so callers never share (and mutate) the same DOM, even when
+        # the HTML comes out of the memo.
+        soup = HTMLParser(html)
+        return soup
+
+    @lru_cache(maxsize=256)
+    def _fetch_html(self, url: str, s: Session = None) -> bytes:
+        """ Gets the raw HTML of a url using the requests module.
+
+        Repeated fetches of the same URL within a run (e.g. the sign-in
+        page, or an IMDb detail page reached through two search rows) are
+        memoized, so they cost neither a round-trip nor a cache lookup.
+
+        Parameters
+        ----------
+        url : str
+            URL to fetch.
+        s : requests.Session
+            Session to request through instead of the shared one. Its
+            default value is None.
+
+        Returns
+        -------
+        html : bytes
+            Raw body of the response, or None on a non-2xx status.
         """
-        headers = {
-            'Accept-Encoding': 'gzip, deflate, sdch',
-            'Accept-Language': 'en-US,en;q=0.8',
-            'Upgrade-Insecure-Requests': '1',
-            'User-Agent':
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like '
-            'Gecko) Chrome/56.0.2924.87 Safari/537.36',
-            'Accept':
-            'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,'
-            '*/*;q=0.8',
-            'Cache-Control': 'max-age=0', 'Connection': 'keep-alive'
-        }
         # Requests a connection to the website. If s is given, it requests
-        # through the specified session.
-        res = get(url, headers=headers) if s is None else s.get(url)
-
-        try:  # In case something goes wrong.
-            res.raise_for_status()
-        except HTTPError as e:
-            message = f"""An error ocurred while requesting to the website.
-                          Original exception: {e}"""
-            self._logger.log(message)
+        # through the specified session; otherwise the shared pooled
+        # session is reused.
+        res = (s or self._session).get(url)
 
-        soup = BeautifulSoup(res.text, features="html.parser")
-        return soup
+        # A non-2xx body is an error page; parsing it would only waste a
+        # full parse and confuse the scrapers downstream.
+        if not res.ok:
+            self._logger.log(f"HTTP {res.status_code} for {url}")
+            return None
+
+        return res.content
+
+    @property
+    def imdb_session(self) -> Session:
+        """ Signed-in IMDb session, shared by every lookup.
+
+        The sign-in (2 GETs + a form POST) is performed once on first
+        access and the resulting session is memoized, instead of repeating
+        the whole handshake for every movie.
+
+        Returns
+        -------
+        s : requests.Session
+            Current session.
+        """
+        with self._imdb_session_lock:
+            if self._imdb_session is None:
+                self._imdb_session = self.sign_in_to_imdb()
+
+            return self._imdb_session
 
     def sign_in_to_imdb(self) -> Session:
         """Signs in to IMDb using the appropiate credentials.
@@ -389,21 +604,25 @@ class MoviesFinder:
         """
         signin_url = IMDB_SIGNIN_URL
         soup = self.soup_from_url(signin_url)
-        sign_in_tag = soup.find('a', attrs={'class': 'list-group-item'})
+        if soup is None:  # The sign-in page could not be fetched.
+            return self._session
+
+        sign_in_tag = soup.css_first(self._SIGNIN_LINK_SELECTOR)
 
         # Gets the actua sign in URL which lets the user sign in with an
         # IMDb account.
-        signin_IMDB_url = sign_in_tag.get('href')
-
-        s = Session()
+        signin_IMDB_url = sign_in_tag.attributes.get('href')
 
         login_data = {
             'email': self.imdb_credentials["email"],
             'password': self.imdb_credentials["password"]
         }
 
-        s.post(signin_IMDB_url, data=login_data)
-        return s
+        # The sign-in happens on the shared session, so the IMDb lookups
+        # reuse both its cookies and its warm connection pools. The POST
+        # itself is never cached (only GETs are allowable).
+        self._session.post(signin_IMDB_url, data=login_data)
+        return self._session
 
     def title_is_accurate(self, title: str, original_title: str,
                           use_levenshtein: bool = True) -> bool:
@@ -420,18 +639,43 @@ class MoviesFinder:
         original_title : str
             Original title of the movie.
         use_levenshtein: bool, optional
-            Whether to use Levenshtein distance or Python's built-in
-            Sequence matcher. By default, True.
+            Whether to use rapidfuzz's Levenshtein-based ratio or Python's
+            built-in Sequence matcher. By default, True.
 
         Returns
         -------
         accuracy : float
             Accuracy of the given title. Float number between 0 and 1.0
         """
+        # Tiered fast paths: most candidate titles are either exactly the
+        # original or trivial variants, so the expensive scorer only runs
+        # on the small residual set.
+        # 1. Exact match.
+        if title == original_title:
+            return True
+
+        # 2. Levenshtein distance is at least the length difference of the
+        # two strings, so a ratio of 0.9 is unreachable whenever
+        # |len(a) - len(b)| > 0.1 * (len(a) + len(b)). This rejects most
+        # IMDb search-result rows (series, episodes, unrelated titles)
+        # without running the scorer at all.
+        la, lb = len(title), len(original_title)
+        if abs(la - lb) > 0.1 * (la + lb):
+            return False
+
+        # 3. One title is a prefix of the other: the edit distance is just
+        # the length difference, so the ratio is determined by the lengths
+        # alone (same value fuzz.ratio would compute).
+        if title.startswith(original_title) or \
+                original_title.startswith(title):
+            return 2 * min(la, lb) / (la + lb) >= 0.9
+
         if use_levenshtein:
-            similarity = Levenshtein.ratio(title, original_title)
-        else:
-            similarity = SequenceMatcher(None, title, original_title).ratio()
+            # rapidfuzz scores in [0, 100]; score_cutoff lets it bail out
+            # early as soon as 90 is unreachable.
+            return fuzz.ratio(title, original_title, score_cutoff=90) >= 90
+
+        similarity = SequenceMatcher(None, title, original_title).ratio()
 
         if similarity >= 0.9:
             return True
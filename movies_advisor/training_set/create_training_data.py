@@ -7,22 +7,22 @@ Created on Thursday, July 1, 22:42:05 GMT+5, 2021.
 """
 import pandas as pd
 from movies_advisor.movies_finder import MoviesFinder
-import dateutil.parser
 from dotenv import dotenv_values
 from pathlib import Path
 import os
 
-def extract_year(date: str) -> int:
-    return dateutil.parser.parse(date).year
-    
 def load_mcu_movies(file_: str = "MCU.csv") -> pd.DataFrame:
-    mcu = pd.read_csv("MCU.csv", delimiter=",").applymap(
-        lambda x: x.strip() if isinstance(x, str) else x
-    )
+    # Column-wise str.strip runs vectorized in C instead of calling a
+    # Python lambda per cell through applymap. is_string_dtype covers both
+    # the classic object dtype and the str dtype newer pandas infers.
+    mcu = pd.read_csv(file_, delimiter=",")
+    mcu = mcu.apply(
+        lambda s: s.str.strip() if pd.api.types.is_string_dtype(s) else s)
     mcu.columns = mcu.columns.str.strip()
     mcu = mcu.rename(columns={"Release date": "Year"})
     mcu = mcu[mcu["Year"].notnull() & (mcu["Film/TV"] == "Film")].drop(["In-universe year", "Film/TV", "Phase"], axis=1)
-    mcu["Year"] = mcu["Year"].apply(extract_year)
+    # Vectorized date parsing instead of dateutil.parser.parse per row.
+    mcu["Year"] = pd.to_datetime(mcu["Year"], format="mixed").dt.year
     return mcu
 
 def load_imdb_credentials(credentials_file: str) -> dict:
@@ -31,11 +31,15 @@ def load_imdb_credentials(credentials_file: str) -> dict:
     config["password"] = config.pop("IMDB_PASS")
     return config
 
-mcu = load_mcu_movies()
-mcu_movies = pd.Series(mcu.Year.values, index=mcu.Title).to_dict()
+def main() -> None:
+    mcu = load_mcu_movies()
+    mcu_movies = pd.Series(mcu.Year.values, index=mcu.Title).to_dict()
 
-credentials_file = os.path.join(Path(os.getcwd()).parents[1], "credentials.env")
-imdb_credentials = load_imdb_credentials(credentials_file=credentials_file)
+    credentials_file = os.path.join(Path(os.getcwd()).parents[1], "credentials.env")
+    imdb_credentials = load_imdb_credentials(credentials_file=credentials_file)
 
-finder = MoviesFinder(mcu_movies, imdb_credentials)
-finder.complete_information(verbose=True)
+    finder = MoviesFinder(mcu_movies, imdb_credentials)
+    finder.complete_information(verbose=True)
+
+if __name__ == "__main__":
+    main()
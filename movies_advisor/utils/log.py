@@ -5,14 +5,21 @@ Created on Wednesday, December 18, 17:15:27 GMT+5, 2019.
 @author: Camilo Martínez
 @location: Barranquilla, Colombia
 """
-from time import mktime
-from datetime import datetime
+import atexit
+from datetime import datetime, timedelta, timezone
+from threading import Lock
 
 # Name of the log file.
 LOG_FILE = "log.txt"
 
-# Datetime format.
-FORMAT = "%d %b %Y %I:%M:%S %p %Z"
+# Timezone of the log timestamps.
+GMT5 = timezone(timedelta(hours=5))
+
+# Datetime format, day name included.
+FORMAT = "%A, %d %b %Y %I:%M:%S %p"
+
+# Number of buffered entries that triggers a flush to disk.
+FLUSH_EVERY = 32
 
 
 class Logger:
@@ -23,35 +30,43 @@ class Logger:
     """
 
     def __init__(self):
-        pass
-
-    def utc2local(self, utc: datetime) -> datetime:
-        """ Converts UTC date to local time date.
-
-        Parameters
-        ----------
-        utc : datetime
-            Current date in UTC.
-
-        Returns
-        -------
-        Datetime object that stores the current date in GMT+5 format.
-        """
-        epoch = mktime(utc.timetuple())
-        offset = datetime.fromtimestamp(
-            epoch) - datetime.utcfromtimestamp(epoch)
-        return utc + offset
+        # A single long-lived handle: one open syscall for the whole run
+        # instead of an open/close pair per entry. Entries are buffered
+        # and written in batches, so logging-heavy runs pay one write
+        # syscall per FLUSH_EVERY entries rather than one each; the
+        # remainder is flushed at interpreter exit. The lock keeps
+        # concurrent scraper threads from interleaving a flush.
+        self._buf = []
+        self._lock = Lock()
+        self._fh = open(LOG_FILE, "a")
+        atexit.register(self._close)
 
     def log(self, message: str) -> None:
-        """ Writes a log entry to the log file. 
-        
+        """ Writes a log entry to the log file.
+
         Parameters
         ----------
         message : str
             Message to log.
         """
-        with open(LOG_FILE, "a") as log:
-            current_date = datetime.utcnow()
-            gmt5_date = self.utc2local(current_date).strftime(FORMAT)
-            day = datetime.now().strftime("%A")
-            log.write(f"{day}, {gmt5_date} GMT+5: {message}\n")
+        # One aware datetime gives both the day name and the GMT+5
+        # timestamp in a single strftime.
+        now = datetime.now(GMT5)
+
+        with self._lock:
+            self._buf.append(f"{now.strftime(FORMAT)} GMT+5: {message}\n")
+            if len(self._buf) >= FLUSH_EVERY:
+                self._flush()
+
+    def _flush(self) -> None:
+        """ Writes the buffered entries to disk. Caller holds the lock. """
+        if self._buf:
+            self._fh.writelines(self._buf)
+            self._buf.clear()
+            self._fh.flush()
+
+    def _close(self) -> None:
+        """ Flushes whatever is left and closes the file handle. """
+        with self._lock:
+            self._flush()
+            self._fh.close()